@@ -4,16 +4,144 @@ No APIs needed - Simple and powerful!
 """
 
 import os
+import hashlib
+import marshal
+import subprocess
 from pathlib import Path
 from typing import List, Optional, Literal
 from PIL import Image, ImageDraw, ImageFont, ImageFilter
 import numpy as np
 from moviepy.editor import (
-    ImageClip, CompositeVideoClip, CompositeAudioClip,
+    VideoClip, CompositeVideoClip, CompositeAudioClip,
     AudioFileClip, concatenate_videoclips
 )
-from moviepy.video.fx.all import fadein, fadeout
+from moviepy.config import get_setting
 import random
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import lru_cache
+
+try:
+    import cv2
+except ImportError:  # OpenCV is optional, Pillow is used for resampling instead
+    cv2 = None
+
+
+FONT_PATHS = ("arial.ttf", "/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf")
+
+
+@lru_cache(maxsize=8)
+def _load_font(size: int):
+    """Load the first available font at the given size, cached per size"""
+    for font_path in FONT_PATHS:
+        try:
+            return ImageFont.truetype(font_path, size)
+        except OSError:
+            continue
+    return ImageFont.load_default()
+
+
+# Content hash of this file, so any edit to the rendering code invalidates
+# cached scene images
+SOURCE_HASH = hashlib.blake2s(Path(__file__).read_bytes(), digest_size=16).hexdigest()
+
+# Methods whose code decides what a scene image looks like
+RENDER_METHODS = (
+    "generate_image_from_prompt", "_gaussian_blur", "_add_gradient",
+    "_add_vignette", "_draw_text_with_outline"
+)
+
+
+SCENE_SIZE = (1920, 1080)
+
+
+def _scene_color(prompt: str) -> tuple:
+    """Background colour for a prompt (stable across runs, unlike the salted hash())"""
+    digest = hashlib.blake2s(prompt.encode(), digest_size=3).digest()
+    return tuple(b % 200 + 50 for b in digest)
+
+
+def _font_key(font) -> tuple:
+    """Identify a loaded font for the scene cache key"""
+    path = getattr(font, 'path', None)
+    return (path if isinstance(path, str) else "default", getattr(font, 'size', None))
+
+
+def _render_code_key(generator) -> str:
+    """
+    Fingerprint the rendering code actually in use: the source file plus the
+    bytecode of the rendering methods, which also covers subclass overrides
+    and methods replaced at runtime
+    """
+    h = hashlib.blake2s(SOURCE_HASH.encode(), digest_size=16)
+    for name in RENDER_METHODS:
+        method = getattr(generator, name)
+        code = getattr(method, '__code__', None)
+        h.update(marshal.dumps(code) if code is not None else repr(method).encode())
+    return h.hexdigest()
+
+
+@lru_cache(maxsize=4)
+def _vignette_mask(width: int, height: int) -> np.ndarray:
+    """Radial falloff mask: 1.0 in the centre, fading towards the corners"""
+    yy, xx = np.ogrid[:height, :width]
+    cy, cx = height / 2, width / 2
+    r2 = ((yy - cy) / cy) ** 2 + ((xx - cx) / cx) ** 2
+    # Stored as 0-255 so the image can be scaled with integer multiply-shift
+    mask = np.round(np.clip(1.0 - r2 * 0.9, 0, 1) * 255).astype(np.uint8)
+    mask.flags.writeable = False
+    return mask
+
+
+@lru_cache(maxsize=4)
+def _gradient_scale(height: int) -> np.ndarray:
+    """
+    Per-row brightness for the gradient effect, darkening linearly from top
+    to bottom down to half brightness, as a (height, 1) 1/256 fixed-point table
+    """
+    scale = (256 - np.arange(height, dtype=np.uint32) * 128 // height).astype(np.uint16)[:, None]
+    scale.flags.writeable = False
+    return scale
+
+
+# Preferred H.264 encoders, fastest first, with their tuning parameters
+ENCODER_PARAMS = {
+    "h264_nvenc": ['-preset', 'p4', '-tune', 'hq'],
+    "h264_videotoolbox": ['-b:v', '8M'],
+    "h264_qsv": ['-preset', 'veryfast'],
+    "libx264": ['-preset', 'veryfast'],
+}
+
+
+@lru_cache(maxsize=None)
+def _detect_video_encoder(ffmpeg: str) -> str:
+    """
+    Return the first H.264 encoder that actually works with this ffmpeg.
+    Hardware encoders are often compiled in without a usable device, so
+    each one is probed with a tiny test encode, using the same options as
+    the real export, rather than just listed.
+    """
+    for codec, params in ENCODER_PARAMS.items():
+        if codec == "libx264":
+            break
+        probe = [
+            ffmpeg, '-v', 'error', '-f', 'lavfi', '-i', 'color=size=256x256:duration=0.1',
+            '-c:v', codec, *params, '-pix_fmt', 'yuv420p', '-f', 'null', '-'
+        ]
+        try:
+            if subprocess.run(probe, capture_output=True, timeout=15).returncode == 0:
+                return codec
+        except (OSError, subprocess.TimeoutExpired):
+            continue
+    return "libx264"
+
+
+def _pan_frame(frame: np.ndarray, out: np.ndarray, shift: int) -> np.ndarray:
+    """Shift frame left by `shift` columns into `out`, wrapping around"""
+    width = frame.shape[1]
+    out[:, :width - shift] = frame[:, shift:]
+    out[:, width - shift:] = frame[:, :shift]
+    return out
 
 
 class AIVideoGenerator:
@@ -25,23 +153,47 @@ class AIVideoGenerator:
         self.temp_dir = self.output_dir / "temp"
         self.temp_dir.mkdir(exist_ok=True)
         
+        self._load_fonts()
+        
+    def _load_fonts(self):
+        """Fonts are loaded once per process and shared by every scene"""
+        self.title_font = _load_font(70)
+        self.overlay_font = _load_font(55)
+    
+    def __getstate__(self):
+        # Fonts are process-local and are not sent to scene workers; each
+        # worker resolves them through its own _load_font cache
+        state = self.__dict__.copy()
+        del state['title_font'], state['overlay_font']
+        return state
+    
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._load_fonts()
+    
     def generate_image_from_prompt(self, prompt: str, index: int, 
                                    text_overlay: Optional[str] = None,
-                                   visual_effect: str = "none") -> str:
+                                   visual_effect: str = "none") -> np.ndarray:
         """
         Generate an image with colored background, text, and visual effects
+        
+        Returns the RGB frame as an array; it is kept uncompressed since it
+        is only ever fed back into the video clips
         """
-        # Create base image with color based on prompt
-        base_color = (
-            hash(prompt) % 200 + 50,
-            (hash(prompt) * 2) % 200 + 50,
-            (hash(prompt) * 3) % 200 + 50
-        )
-        img = Image.new('RGB', (1920, 1080), color=base_color)
+        # Identical scenes render identically, so reuse a previously saved image
+        cache_path = self._scene_cache_path(prompt, index, text_overlay, visual_effect)
+        if cache_path.exists():
+            try:
+                return np.load(cache_path)
+            except (OSError, ValueError):
+                pass  # Unreadable cache entry, render the scene again
+        
+        base_color = _scene_color(prompt)
+        img = Image.new('RGB', SCENE_SIZE, color=base_color)
         
         # Apply visual effects to background
         if visual_effect == "blur":
-            img = img.filter(ImageFilter.GaussianBlur(radius=15))
+            img = self._gaussian_blur(img, radius=15)
         elif visual_effect == "gradient":
             img = self._add_gradient(img, base_color)
         elif visual_effect == "vignette":
@@ -49,55 +201,70 @@ class AIVideoGenerator:
         
         draw = ImageDraw.Draw(img)
         
-        # Load fonts
-        try:
-            title_font = ImageFont.truetype("arial.ttf", 70)
-            overlay_font = ImageFont.truetype("arial.ttf", 55)
-        except:
-            try:
-                title_font = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf", 70)
-                overlay_font = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf", 55)
-            except:
-                title_font = ImageFont.load_default()
-                overlay_font = ImageFont.load_default()
-        
         # Add scene number at top
         text = f"Scene {index + 1}"
-        self._draw_text_with_outline(draw, text, (960, 350), title_font, 'white', 'black')
+        self._draw_text_with_outline(draw, text, (960, 350), self.title_font, 'white', 'black')
         
         # Add text overlay in the CENTER if provided
         if text_overlay:
-            self._draw_text_with_outline(draw, text_overlay, (960, 540), overlay_font, 'white', 'black')
+            self._draw_text_with_outline(draw, text_overlay, (960, 540), self.overlay_font, 'white', 'black')
         
-        img_path = self.temp_dir / f"scene_{index}.png"
-        img.save(img_path)
-        return str(img_path)
+        frame = np.asarray(img)
+        # Write under a temporary name first so an interrupted run can't leave
+        # a truncated cache entry behind
+        tmp_path = cache_path.with_name(f"{cache_path.stem}.{os.getpid()}.tmp")
+        with open(tmp_path, 'wb') as f:
+            np.save(f, frame)
+        os.replace(tmp_path, cache_path)
+        return frame
+    
+    def _scene_cache_path(self, prompt: str, index: int,
+                          text_overlay: Optional[str], visual_effect: str) -> Path:
+        """
+        Cache file for a scene image. The key covers everything that goes into
+        the image, including the rendering code itself, so edits never pick up
+        stale scenes
+        """
+        render_params = (
+            _render_code_key(self), SCENE_SIZE, _scene_color(prompt),
+            _font_key(self.title_font), _font_key(self.overlay_font),
+            prompt, index, text_overlay, visual_effect
+        )
+        key = hashlib.blake2s(repr(render_params).encode(), digest_size=16).hexdigest()
+        return self.temp_dir / f"scene_{key}.npy"
+    
+    def _prune_scene_cache(self, keep: set):
+        """Delete cached scene images (and leftover partial writes) not in `keep`"""
+        for file in self.temp_dir.glob("scene_*"):
+            if file not in keep:
+                try:
+                    file.unlink()
+                except OSError:
+                    pass
+    
+    def _gaussian_blur(self, img: Image.Image, radius: float) -> Image.Image:
+        """Blur the image; Pillow's GaussianBlur is already separable box passes"""
+        # Blurring a single flat colour (the plain scene background) is a no-op
+        if all(low == high for low, high in img.getextrema()):
+            return img
+        return img.filter(ImageFilter.GaussianBlur(radius=radius))
     
     def _add_gradient(self, img: Image.Image, base_color: tuple) -> Image.Image:
         """Add a gradient effect to the image"""
-        gradient = Image.new('RGB', img.size)
-        draw = ImageDraw.Draw(gradient)
+        width, height = img.size
         
-        for y in range(img.size[1]):
-            progress = y / img.size[1]
-            color = tuple(int(c * (1 - progress * 0.5)) for c in base_color)
-            draw.line([(0, y), (img.size[0], y)], fill=color)
+        # Scale the prompt colour by the shared row ramp, then broadcast across the width
+        scale = _gradient_scale(height)
+        row_colors = ((np.array(base_color, dtype=np.uint16) * scale) >> 8).astype(np.uint8)
+        gradient = np.broadcast_to(row_colors[:, None, :], (height, width, 3)).copy()
         
-        return Image.blend(img, gradient, 0.7)
+        return Image.blend(img, Image.fromarray(gradient), 0.7)
     
     def _add_vignette(self, img: Image.Image) -> Image.Image:
         """Add a vignette (darkened edges) effect"""
-        mask = Image.new('L', img.size, 0)
-        draw = ImageDraw.Draw(mask)
-        
-        for i in range(255):
-            xy = (i, i, img.size[0]-i, img.size[1]-i)
-            draw.rectangle(xy, fill=i)
-        
-        mask = mask.filter(ImageFilter.GaussianBlur(radius=100))
-        
-        overlay = Image.new('RGB', img.size, (0, 0, 0))
-        return Image.composite(img, overlay, mask)
+        mask = _vignette_mask(*img.size)
+        out = (np.multiply(np.asarray(img), mask[..., None], dtype=np.uint16) >> 8).astype(np.uint8)
+        return Image.fromarray(out)
     
     def _draw_text_with_outline(self, draw, text, position, font, fill_color, outline_color, outline_width=4):
         """Draw text with outline for better visibility"""
@@ -112,63 +279,142 @@ class AIVideoGenerator:
         x = x - text_width // 2
         y = y - text_height // 2
         
-        # Draw outline
-        for adj_x in range(-outline_width, outline_width + 1):
-            for adj_y in range(-outline_width, outline_width + 1):
-                draw.text((x + adj_x, y + adj_y), text, font=font, fill=outline_color)
-        
-        # Draw main text
-        draw.text((x, y), text, font=font, fill=fill_color)
+        # Draw text and outline in a single pass
+        draw.text((x, y), text, font=font, fill=fill_color,
+                  stroke_width=outline_width, stroke_fill=outline_color)
     
-    def create_scene(self, image_path: str, duration: float, 
-                     effect: Literal["zoom", "pan", "static"] = "zoom") -> ImageClip:
-        """Create a video scene with various camera effects"""
-        clip = ImageClip(image_path).set_duration(duration)
-        
-        if effect == "zoom":
-            def zoom_in(get_frame, t):
-                frame = get_frame(t)
+    def create_scene(self, image: np.ndarray, duration: float, 
+                     effect: Literal["zoom", "pan", "static"] = "zoom",
+                     fps: int = 24, fade_duration: float = 0.5) -> VideoClip:
+        """
+        Create a video scene with various camera effects
+        
+        Camera motion and the fade are computed together by a single frame
+        function, instead of stacking one moviepy callback per effect
+        """
+        source = np.asarray(image)
+        h, w = source.shape[:2]
+        if effect == "zoom" and cv2 is None:
+            # The scene is a still image, so convert it to PIL once up front
+            source_img = Image.fromarray(source)
+        # Shifted frames are written into one scratch buffer per clip
+        pan_buffer = np.empty_like(source) if effect == "pan" else None
+        
+        # Per-frame fade brightness, precomputed in 1/256 fixed point. The fade-in
+        # and fade-out ramps multiply, as with moviepy's fadein + fadeout, which
+        # matters when they overlap in scenes shorter than two fades
+        times = np.arange(max(1, int(round(duration * fps)))) / fps
+        fade_in = np.clip(times / fade_duration, 0, 1)
+        fade_out = np.clip((duration - times) / fade_duration, 0, 1)
+        alpha_lut = np.round(fade_in * fade_out * 256).astype(np.uint16)
+        
+        def make_frame(t):
+            frame = source
+            if effect == "zoom":
                 zoom_factor = 1 + (t / duration) * 0.2  # 20% zoom
-                h, w = frame.shape[:2]
-                new_h, new_w = int(h / zoom_factor), int(w / zoom_factor)
-                top = (h - new_h) // 2
-                left = (w - new_w) // 2
-                cropped = frame[top:top+new_h, left:left+new_w]
-                return np.array(Image.fromarray(cropped).resize((w, h), Image.Resampling.LANCZOS))
-            clip = clip.fl(zoom_in)
-            
-        elif effect == "pan":
-            def pan_right(get_frame, t):
-                frame = get_frame(t)
-                h, w = frame.shape[:2]
+                crop_w, crop_h = w / zoom_factor, h / zoom_factor
+                left, top = (w - crop_w) / 2, (h - crop_h) / 2
+                if cv2 is not None:
+                    # Map each output pixel centre back into the float crop box, so
+                    # the zoom stays sub-pixel smooth like the Pillow path below
+                    inv = 1 / zoom_factor
+                    matrix = np.float32([
+                        [inv, 0, left + 0.5 * inv - 0.5],
+                        [0, inv, top + 0.5 * inv - 0.5],
+                    ])
+                    frame = cv2.warpAffine(
+                        source, matrix, (w, h),
+                        flags=cv2.INTER_LINEAR | cv2.WARP_INVERSE_MAP,
+                        borderMode=cv2.BORDER_REPLICATE
+                    )
+                else:
+                    # Crop and scale in a single resampling pass. Bilinear instead of
+                    # Lanczos: the upscale is at most 1.2x, where the two differ only
+                    # slightly along text edges, and it costs less than half as much
+                    box = (left, top, left + crop_w, top + crop_h)
+                    frame = np.asarray(source_img.resize((w, h), Image.Resampling.BILINEAR, box=box))
+            elif effect == "pan":
                 shift = int((t / duration) * w * 0.1)  # Pan 10% across
                 if shift > 0:
-                    frame = np.roll(frame, -shift, axis=1)
+                    frame = _pan_frame(source, pan_buffer, shift)
+            
+            alpha = alpha_lut[min(int(round(t * fps)), len(alpha_lut) - 1)]
+            if alpha >= 256:
                 return frame
-            clip = clip.fl(pan_right)
+            return (np.multiply(frame, alpha, dtype=np.uint16) >> 8).astype(np.uint8)
+        
+        return VideoClip(make_frame, duration=duration)
+    
+    def _write_video(self, clips: List[VideoClip], audio, output_path: str, fps: int = 24,
+                     hw_accel: Optional[str] = None):
+        """
+        Stream the raw RGB frames of every scene straight into ffmpeg,
+        bypassing moviepy's compositing and writer for the video track
+        """
+        width, height = clips[0].size
+        duration = sum(clip.duration for clip in clips)
+        
+        ffmpeg = get_setting("FFMPEG_BINARY")
+        codec = hw_accel or _detect_video_encoder(ffmpeg)
+        
+        cmd = [
+            ffmpeg, '-y', '-loglevel', 'error',
+            '-f', 'rawvideo', '-pix_fmt', 'rgb24', '-s', f'{width}x{height}',
+            '-r', str(fps), '-i', '-'
+        ]
+        if audio is not None:
+            # Mix the audio down once, padded or trimmed to the video length
+            audio_path = self.temp_dir / "audio.wav"
+            audio.set_duration(duration).write_audiofile(
+                str(audio_path), fps=44100, codec='pcm_s16le', logger=None
+            )
+            cmd += ['-i', str(audio_path), '-c:a', 'aac', '-shortest']
+        cmd += ['-c:v', codec, *ENCODER_PARAMS.get(codec, []), '-pix_fmt', 'yuv420p', output_path]
+        
+        process = subprocess.Popen(cmd, stdin=subprocess.PIPE)
+        try:
+            for clip in clips:
+                for i in range(int(round(clip.duration * fps))):
+                    frame = clip.get_frame(i / fps)
+                    process.stdin.write(frame.astype(np.uint8, copy=False).tobytes())
+        except BrokenPipeError:
+            # ffmpeg exited early; its return code below says why
+            pass
+        finally:
+            try:
+                process.stdin.close()
+            except BrokenPipeError:
+                pass
+            process.wait()
         
-        # Add fade transitions
-        clip = fadein(clip, 0.5)
-        clip = fadeout(clip, 0.5)
+        if process.returncode != 0:
+            raise RuntimeError(f"ffmpeg exited with code {process.returncode}")
+    
+    def _create_tts_engine(self):
+        """Create and configure a text-to-speech engine"""
+        import pyttsx3
+        engine = pyttsx3.init()
         
-        return clip
+        # Configure voice settings
+        engine.setProperty('rate', 150)  # Speed of speech
+        engine.setProperty('volume', 0.9)  # Volume (0.0 to 1.0)
+        return engine
     
-    def text_to_speech(self, text: str, output_path: str) -> bool:
+    def text_to_speech(self, text: str, output_path: str, engine=None) -> bool:
         """
         Generate voice over from text using text-to-speech
         Requires: pip install pyttsx3 (for offline TTS)
         
+        If an engine is given, the file is only queued on it and gets written
+        by that engine's next runAndWait() call
+        
         Returns True if successful, False otherwise
         """
         try:
-            import pyttsx3
-            engine = pyttsx3.init()
-            
-            # Configure voice settings
-            engine.setProperty('rate', 150)  # Speed of speech
-            engine.setProperty('volume', 0.9)  # Volume (0.0 to 1.0)
-            
-            # Save to file
+            if engine is not None:
+                engine.save_to_file(text, output_path)
+                return True
+            engine = self._create_tts_engine()
             engine.save_to_file(text, output_path)
             engine.runAndWait()
             return True
@@ -179,6 +425,41 @@ class AIVideoGenerator:
             print(f"⚠️  Text-to-speech failed: {e}")
             return False
     
+    def _generate_voice_overs(self, voice_over_texts: List[str]) -> List[Optional[str]]:
+        """
+        Queue every voice over on one engine and synthesize them in one run.
+        The engine is created here, on the thread that uses it, since some
+        backends (SAPI5 via COM) only work on the thread they were set up on
+        """
+        try:
+            engine = self._create_tts_engine()
+        except ImportError:
+            print("⚠️  pyttsx3 not installed. Run: pip install pyttsx3")
+            return [None] * len(voice_over_texts)
+        except Exception as e:
+            print(f"⚠️  Text-to-speech failed: {e}")
+            return [None] * len(voice_over_texts)
+        
+        voice_files = []
+        for i, voice_text in enumerate(voice_over_texts):
+            voice_path = self.temp_dir / f"voice_{i}.wav"
+            if voice_text and self.text_to_speech(voice_text, str(voice_path), engine=engine):
+                voice_files.append(str(voice_path))
+            else:
+                voice_files.append(None)
+        
+        if any(voice_files):
+            try:
+                engine.runAndWait()
+            except Exception as e:
+                print(f"⚠️  Text-to-speech failed: {e}")
+                return [None] * len(voice_files)
+        
+        for i, voice_path in enumerate(voice_files):
+            if voice_path:
+                print(f"  ✅ Voice over {i+1} generated")
+        return voice_files
+    
     def generate_video(self, 
                       prompts: List[str],
                       scene_duration: float = 7.0,
@@ -188,7 +469,8 @@ class AIVideoGenerator:
                       background_music: Optional[str] = None,
                       voice_over_texts: Optional[List[str]] = None,
                       music_volume: float = 0.3,
-                      output_filename: str = "output_video.mp4") -> str:
+                      output_filename: str = "output_video.mp4",
+                      hw_accel: Optional[str] = None) -> str:
         """
         Generate a complete video with all features
         
@@ -202,6 +484,8 @@ class AIVideoGenerator:
             voice_over_texts: Text to convert to speech for each scene
             music_volume: Background music volume (0.0 to 1.0)
             output_filename: Output video filename
+            hw_accel: H.264 encoder to use, e.g. "h264_nvenc" or "libx264"
+                      (None picks the fastest encoder that works on this machine)
         
         Returns:
             Path to generated video
@@ -214,37 +498,55 @@ class AIVideoGenerator:
         if visual_effects is None:
             visual_effects = ["gradient"] * len(prompts)
         
-        # Generate voice overs if requested
-        voice_files = []
-        if voice_over_texts:
-            print("🎤 Generating voice overs...")
-            for i, voice_text in enumerate(voice_over_texts):
-                if voice_text:
-                    voice_path = self.temp_dir / f"voice_{i}.mp3"
-                    if self.text_to_speech(voice_text, str(voice_path)):
-                        voice_files.append(str(voice_path))
-                        print(f"  ✅ Voice over {i+1} generated")
-                    else:
-                        voice_files.append(None)
-                else:
-                    voice_files.append(None)
-        
         # Generate images for each prompt
         print(f"📸 Generating {len(prompts)} scenes...")
-        image_paths = []
+        overlays = []
+        effects = []
         for i, prompt in enumerate(prompts):
-            overlay = text_overlays[i] if text_overlays and i < len(text_overlays) else None
-            effect = visual_effects[i] if i < len(visual_effects) else "none"
+            overlays.append(text_overlays[i] if text_overlays and i < len(text_overlays) else None)
+            effects.append(visual_effects[i] if i < len(visual_effects) else "none")
             print(f"  Scene {i+1}/{len(prompts)}: {prompt}")
-            img_path = self.generate_image_from_prompt(prompt, i, overlay, effect)
-            image_paths.append(img_path)
+        
+        # Scenes are independent and CPU-bound, so render them in parallel.
+        # Voice overs don't depend on the images either, so they are synthesized
+        # on a background thread meanwhile (started after map() so the scene
+        # workers are forked before any extra thread exists)
+        voice_files = []
+        with ProcessPoolExecutor() as executor, ThreadPoolExecutor(max_workers=1) as tts_executor:
+            image_results = executor.map(
+                self.generate_image_from_prompt,
+                prompts, range(len(prompts)), overlays, effects
+            )
+            voice_future = None
+            if voice_over_texts:
+                print("🎤 Generating voice overs...")
+                voice_future = tts_executor.submit(self._generate_voice_overs, voice_over_texts)
+            
+            try:
+                images = list(image_results)
+            except BrokenProcessPool:
+                # Worker processes can't start, e.g. under the spawn start method
+                # (Windows, macOS) from a script without a __main__ guard
+                print("⚠️  Could not start worker processes, rendering scenes one by one")
+                images = list(map(
+                    self.generate_image_from_prompt,
+                    prompts, range(len(prompts)), overlays, effects
+                ))
+            if voice_future is not None:
+                voice_files = voice_future.result()
+        
+        # Only this run's scenes stay cached, so temp/ doesn't grow with every
+        # new set of prompts
+        self._prune_scene_cache(set(map(
+            self._scene_cache_path, prompts, range(len(prompts)), overlays, effects
+        )))
         
         # Create video clips
         print("🎞️  Creating video clips with effects...")
         clips = []
-        for i, img_path in enumerate(image_paths):
+        for i, image in enumerate(images):
             cam_effect = camera_effects[i] if i < len(camera_effects) else "zoom"
-            clip = self.create_scene(img_path, scene_duration, cam_effect)
+            clip = self.create_scene(image, scene_duration, cam_effect)
             
             # Add voice over audio to this clip if available
             if voice_files and i < len(voice_files) and voice_files[i]:
@@ -256,9 +558,10 @@ class AIVideoGenerator:
             
             clips.append(clip)
         
-        # Concatenate clips
+        # Concatenate clips. Only the timeline and the combined audio of the
+        # result are used; _write_video renders the frames from each clip
         print("✂️  Combining clips...")
-        final_clip = concatenate_videoclips(clips, method="compose")
+        final_clip = concatenate_videoclips(clips, method="chain")
         
         # Add background music
         if background_music and os.path.exists(background_music):
@@ -288,12 +591,7 @@ class AIVideoGenerator:
         # Export video
         output_path = self.output_dir / output_filename
         print(f"💾 Exporting video to {output_path}...")
-        final_clip.write_videofile(
-            str(output_path),
-            fps=24,
-            codec='libx264',
-            audio_codec='aac'
-        )
+        self._write_video(clips, final_clip.audio, str(output_path), fps=24, hw_accel=hw_accel)
         
         print(f"✅ Video generated successfully: {output_path}")
         return str(output_path)